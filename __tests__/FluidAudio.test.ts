@@ -78,6 +78,17 @@ describe('FluidAudio', () => {
       expect(mockModule.transcribeAudioData).toHaveBeenCalledWith('base64audio', 16000);
     });
 
+    it('should base64-encode audio buffers', async () => {
+      const bytes = new Uint8Array(20000).map((_, i) => i % 256);
+      await asr.initialize();
+      await asr.transcribeBuffer(bytes.buffer, 16000);
+
+      expect(mockModule.transcribeAudioData).toHaveBeenCalledWith(
+        Buffer.from(bytes).toString('base64'),
+        16000
+      );
+    });
+
     it('should check availability', async () => {
       const available = await asr.isAvailable();
 
@@ -197,6 +208,27 @@ describe('FluidAudio', () => {
       expect(segments.length).toBe(1);
       expect(segments[0]!.start).toBe(0);
     });
+
+    it('should re-threshold speech segments from probabilities', () => {
+      const mockResult = {
+        results: [
+          { chunkIndex: 0, probability: 0.9, isActive: true, processingTime: 0.01 },
+          { chunkIndex: 1, probability: 0.6, isActive: false, processingTime: 0.01 },
+          { chunkIndex: 2, probability: 0.9, isActive: true, processingTime: 0.01 },
+          { chunkIndex: 3, probability: 0.1, isActive: false, processingTime: 0.01 },
+        ],
+        chunkSize: 4096,
+        sampleRate: 16000,
+      };
+
+      expect(vad.getSpeechSegments(mockResult).length).toBe(2);
+
+      const segments = vad.getSpeechSegments(mockResult, 0.5);
+
+      expect(segments.length).toBe(1);
+      expect(segments[0]!.start).toBe(0);
+      expect(segments[0]!.end).toBe((3 * 4096) / 16000);
+    });
   });
 
   describe('DiarizationManager', () => {
@@ -4,16 +4,27 @@ import AVFoundation
 import FluidAudio
 import Accelerate
 
-// Helper extension for unique elements
-extension Sequence where Element: Hashable {
-    func uniqued() -> [Element] {
-        var seen = Set<Element>()
-        return filter { seen.insert($0).inserted }
-    }
-}
-
 // Audio conversion utilities
 enum AudioUtils {
+    // Convert little-endian 16-bit PCM bytes to Float samples in [-1, 1)
+    static func convertPCM16ToFloat(_ data: Data) -> [Float] {
+        let sampleCount = data.count / MemoryLayout<Int16>.size
+        var samples = [Float](repeating: 0, count: sampleCount)
+        guard sampleCount > 0 else { return samples }
+
+        data.withUnsafeBytes { ptr in
+            let int16Ptr = ptr.bindMemory(to: Int16.self)
+            samples.withUnsafeMutableBufferPointer { out in
+                guard let src = int16Ptr.baseAddress, let dst = out.baseAddress else { return }
+                var scale: Float = 1 / 32768.0
+                vDSP_vflt16(src, 1, dst, 1, vDSP_Length(sampleCount))
+                vDSP_vsmul(dst, 1, &scale, dst, 1, vDSP_Length(sampleCount))
+            }
+        }
+
+        return samples
+    }
+
     static func convertToMono16kHz(_ buffer: AVAudioPCMBuffer) -> [Float] {
         guard let channelData = buffer.floatChannelData else { return [] }
 
@@ -21,17 +32,20 @@ enum AudioUtils {
         let channelCount = Int(buffer.format.channelCount)
         let sourceSampleRate = buffer.format.sampleRate
 
+        // Start from the first channel so mono input is copied exactly once
+        var monoSamples = Array(UnsafeBufferPointer(start: channelData[0], count: frameLength))
+
         // Mix to mono if stereo
-        var monoSamples = [Float](repeating: 0, count: frameLength)
-        if channelCount == 1 {
-            monoSamples = Array(UnsafeBufferPointer(start: channelData[0], count: frameLength))
-        } else {
-            for i in 0..<frameLength {
-                var sum: Float = 0
-                for ch in 0..<channelCount {
-                    sum += channelData[ch][i]
+        if channelCount > 1 {
+            // Sum channels with vDSP rather than per-sample loops, then average
+            monoSamples.withUnsafeMutableBufferPointer { mono in
+                guard let monoPtr = mono.baseAddress else { return }
+                let length = vDSP_Length(frameLength)
+                for ch in 1..<channelCount {
+                    vDSP_vadd(monoPtr, 1, channelData[ch], 1, monoPtr, 1, length)
                 }
-                monoSamples[i] = sum / Float(channelCount)
+                var scale = 1 / Float(channelCount)
+                vDSP_vsmul(monoPtr, 1, &scale, monoPtr, 1, length)
             }
         }
 
@@ -43,17 +57,41 @@ enum AudioUtils {
         let ratio = 16000.0 / sourceSampleRate
         let outputLength = Int(Double(frameLength) * ratio)
         var outputSamples = [Float](repeating: 0, count: outputLength)
-
-        // Simple linear interpolation resampling
-        for i in 0..<outputLength {
-            let srcIndex = Double(i) / ratio
-            let srcIndexInt = Int(srcIndex)
-            let frac = Float(srcIndex - Double(srcIndexInt))
-
-            if srcIndexInt + 1 < frameLength {
-                outputSamples[i] = monoSamples[srcIndexInt] * (1 - frac) + monoSamples[srcIndexInt + 1] * frac
-            } else if srcIndexInt < frameLength {
-                outputSamples[i] = monoSamples[srcIndexInt]
+        guard outputLength > 0 else { return outputSamples }
+
+        // Linear interpolation resampling with vDSP_vlint. Source positions are
+        // generated per block relative to a block offset so Float indices keep
+        // their fractional precision on long files. The duplicated last sample
+        // lets the final position interpolate against itself.
+        monoSamples.append(monoSamples[frameLength - 1])
+        let blockSize = 4096
+        var indices = [Float](repeating: 0, count: blockSize)
+
+        monoSamples.withUnsafeBufferPointer { src in
+            outputSamples.withUnsafeMutableBufferPointer { dst in
+                indices.withUnsafeMutableBufferPointer { idx in
+                    guard let srcPtr = src.baseAddress,
+                          let dstPtr = dst.baseAddress,
+                          let idxPtr = idx.baseAddress else { return }
+
+                    var step = Float(1 / ratio)
+                    var lower: Float = 0
+                    var blockStart = 0
+                    while blockStart < outputLength {
+                        let count = vDSP_Length(min(blockSize, outputLength - blockStart))
+                        let srcPosition = Double(blockStart) / ratio
+                        let srcOffset = min(Int(srcPosition), frameLength - 1)
+                        var start = Float(srcPosition - Double(srcOffset))
+                        var upper = Float(frameLength - 1 - srcOffset)
+
+                        vDSP_vramp(&start, &step, idxPtr, 1, count)
+                        vDSP_vclip(idxPtr, 1, &lower, &upper, idxPtr, 1, count)
+                        vDSP_vlint(srcPtr + srcOffset, idxPtr, 1, dstPtr + blockStart, 1,
+                                   count, vDSP_Length(frameLength + 1 - srcOffset))
+
+                        blockStart += Int(count)
+                    }
+                }
             }
         }
 
@@ -230,10 +268,7 @@ class FluidAudioModule: RCTEventEmitter {
 
         Task {
             do {
-                let samples = audioData.withUnsafeBytes { ptr -> [Float] in
-                    let int16Ptr = ptr.bindMemory(to: Int16.self)
-                    return int16Ptr.map { Float($0) / 32768.0 }
-                }
+                let samples = AudioUtils.convertPCM16ToFloat(audioData)
 
                 let result = try await asrManager.transcribe(samples)
 
@@ -463,10 +498,7 @@ class FluidAudioModule: RCTEventEmitter {
 
         Task {
             do {
-                let samples = audioData.withUnsafeBytes { ptr -> [Float] in
-                    let int16Ptr = ptr.bindMemory(to: Int16.self)
-                    return int16Ptr.map { Float($0) / 32768.0 }
-                }
+                let samples = AudioUtils.convertPCM16ToFloat(audioData)
 
                 let results = try await vadManager.process(samples)
 
@@ -582,20 +614,7 @@ class FluidAudioModule: RCTEventEmitter {
                 let samples = AudioUtils.convertToMono16kHz(buffer)
                 let result = try diarizerManager.performCompleteDiarization(samples, sampleRate: 16000)
 
-                let segments = result.segments.map { segment -> [String: Any] in
-                    return [
-                        "speakerId": segment.speakerId,
-                        "startTime": segment.startTimeSeconds,
-                        "endTime": segment.endTimeSeconds,
-                        "duration": segment.durationSeconds,
-                        "qualityScore": segment.qualityScore
-                    ]
-                }
-
-                resolve([
-                    "segments": segments,
-                    "speakerCount": result.segments.map { $0.speakerId }.uniqued().count
-                ])
+                resolve(self.diarizationResponse(result))
             } catch {
                 reject("DIARIZATION_ERROR", "Failed to perform diarization: \(error.localizedDescription)", error)
             }
@@ -621,33 +640,55 @@ class FluidAudioModule: RCTEventEmitter {
 
         Task {
             do {
-                let samples = audioData.withUnsafeBytes { ptr -> [Float] in
-                    let int16Ptr = ptr.bindMemory(to: Int16.self)
-                    return int16Ptr.map { Float($0) / 32768.0 }
-                }
+                let samples = AudioUtils.convertPCM16ToFloat(audioData)
 
                 let result = try diarizerManager.performCompleteDiarization(samples, sampleRate: sampleRate)
 
-                let segments = result.segments.map { segment -> [String: Any] in
-                    return [
-                        "speakerId": segment.speakerId,
-                        "startTime": segment.startTimeSeconds,
-                        "endTime": segment.endTimeSeconds,
-                        "duration": segment.durationSeconds,
-                        "qualityScore": segment.qualityScore
-                    ]
-                }
-
-                resolve([
-                    "segments": segments,
-                    "speakerCount": result.segments.map { $0.speakerId }.uniqued().count
-                ])
+                resolve(self.diarizationResponse(result))
             } catch {
                 reject("DIARIZATION_ERROR", "Failed to perform diarization: \(error.localizedDescription)", error)
             }
         }
     }
 
+    // Serialize segments and collect speaker IDs in a single pass
+    private func diarizationResponse(_ result: DiarizationResult) -> [String: Any] {
+        var speakerIds = Set<String>()
+        var segments: [[String: Any]] = []
+        segments.reserveCapacity(result.segments.count)
+
+        for segment in result.segments {
+            speakerIds.insert(segment.speakerId)
+            segments.append([
+                "speakerId": segment.speakerId,
+                "startTime": segment.startTimeSeconds,
+                "endTime": segment.endTimeSeconds,
+                "duration": segment.durationSeconds,
+                "qualityScore": segment.qualityScore
+            ])
+        }
+
+        var response: [String: Any] = [
+            "segments": segments,
+            "speakerCount": speakerIds.count
+        ]
+        if let timings = result.timings {
+            response["timings"] = diarizationTimings(timings)
+        }
+        return response
+    }
+
+    // Per-stage timings so callers can see whether segmentation, embedding
+    // extraction or clustering dominates processing time
+    private func diarizationTimings(_ timings: PipelineTimings) -> [String: Any] {
+        return [
+            "total": timings.totalProcessingSeconds,
+            "segmentation": timings.segmentationSeconds,
+            "embedding": timings.embeddingExtractionSeconds,
+            "clustering": timings.speakerClusteringSeconds
+        ]
+    }
+
     @objc(initializeKnownSpeakers:resolver:rejecter:)
     func initializeKnownSpeakers(
         speakers: NSArray,
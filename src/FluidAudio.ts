@@ -300,9 +300,15 @@ export class VADManager {
   /**
    * Get speech segments from VAD results
    * @param vadResult VAD processing result
+   * @param threshold Optional probability threshold (0-1). When set, chunks are
+   *   re-classified from their probabilities instead of `isActive`, so different
+   *   thresholds can be tried without reprocessing the audio.
    * @returns Array of speech segments with start/end times
    */
-  getSpeechSegments(vadResult: VADResult): Array<{ start: number; end: number }> {
+  getSpeechSegments(
+    vadResult: VADResult,
+    threshold?: number
+  ): Array<{ start: number; end: number }> {
     const segments: Array<{ start: number; end: number }> = [];
     let segmentStart: number | null = null;
 
@@ -310,10 +316,11 @@ export class VADManager {
 
     for (const chunk of vadResult.results) {
       const chunkTime = chunk.chunkIndex * chunkDuration;
+      const isActive = threshold === undefined ? chunk.isActive : chunk.probability >= threshold;
 
-      if (chunk.isActive && segmentStart === null) {
+      if (isActive && segmentStart === null) {
         segmentStart = chunkTime;
-      } else if (!chunk.isActive && segmentStart !== null) {
+      } else if (!isActive && segmentStart !== null) {
         segments.push({ start: segmentStart, end: chunkTime });
         segmentStart = null;
       }
@@ -532,16 +539,19 @@ export async function cleanup(): Promise<void> {
 // Helper Functions
 // ============================================================================
 
+// Bytes per String.fromCharCode call; kept well below engine argument limits
+const BASE64_CHUNK_SIZE = 0x2000;
+
 /**
  * Convert ArrayBuffer to base64 string
  */
 function arrayBufferToBase64(buffer: ArrayBuffer): string {
   const bytes = new Uint8Array(buffer);
-  let binary = '';
-  for (let i = 0; i < bytes.byteLength; i++) {
-    binary += String.fromCharCode(bytes[i]!);
+  const chunks: string[] = [];
+  for (let i = 0; i < bytes.byteLength; i += BASE64_CHUNK_SIZE) {
+    chunks.push(String.fromCharCode(...bytes.subarray(i, i + BASE64_CHUNK_SIZE)));
   }
-  return btoa(binary);
+  return btoa(chunks.join(''));
 }
 
 /**